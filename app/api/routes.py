@@ -3,11 +3,13 @@ API Routes
 Defines all API endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, text
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
+from sqlalchemy import select, insert, exists, func, desc, text, tuple_
 from typing import List, Optional
-from datetime import datetime, timedelta
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 
 from app.db.database import get_db
 from app.models.schemas import (
@@ -21,6 +23,7 @@ from app.models.schemas import (
 from app.models.scan import ScanResult, UserFeedback
 from app.services.analyzer_service import analyzer_service
 from app.services.cache import cache
+from app.services.compression import decompress_text
 from app.core.config import settings
 
 router = APIRouter()
@@ -29,7 +32,8 @@ router = APIRouter()
 @router.post("/analyze", response_model=AnalyzeResponse, tags=["Analysis"])
 async def analyze_content(
     request: AnalyzeRequest,
-    db: Session = Depends(get_db)
+    background: BackgroundTasks,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Analyze content for credibility
@@ -52,43 +56,160 @@ async def analyze_content(
             content_type=request.content_type,
             source_app=request.source_app or "Unknown",
             user_id_hash=request.user_id_hash or "anonymous",
-            db=db
+            db=db,
+            background=background
         )
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
+@router.get("/analyze/{scan_id}", response_model=AnalyzeResponse, tags=["Analysis"])
+async def get_scan(
+    scan_id: str,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get a single scan result with full content
+
+    List views return a 256-char content preview; this endpoint
+    decompresses and returns the complete stored content.
+    """
+    scan = (await db.execute(
+        select(ScanResult).where(ScanResult.id == scan_id)
+    )).scalars().first()
+    if not scan:
+        raise HTTPException(status_code=404, detail="Scan not found")
+
+    if scan.content_compressed:
+        content = decompress_text(scan.content_compressed)
+    else:
+        content = scan.content_preview or ""
+
+    return AnalyzeResponse(
+        id=scan.id,
+        content=content,
+        content_type=scan.content_type,
+        verdict=scan.verdict,
+        credibility_score=scan.credibility_score,
+        confidence=scan.confidence,
+        timestamp=int(scan.timestamp.timestamp() * 1000),
+        source_app=scan.source_app,
+        sources=scan.sources or [],
+        explanation={
+            'summary': scan.explanation_summary,
+            'reasons': scan.explanation_reasons or []
+        },
+        processing_tier=scan.processing_tier,
+        processing_time_ms=scan.processing_time_ms,
+        cached=scan.cached
+    )
+
+
 @router.get("/history", response_model=ScanHistoryResponse, tags=["History"])
-def get_scan_history(
+async def get_scan_history(
     user_id_hash: str = Query(..., description="Hashed user identifier"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db)
+    before_ts: Optional[int] = Query(None, description="Keyset cursor: microsecond timestamp from next_cursor"),
+    before_id: Optional[str] = Query(None, description="Keyset cursor tiebreaker: next_cursor_id from the previous page"),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get scan history for a user
 
     Returns paginated list of previous scans performed by the user.
+    Pass the returned `next_cursor` and `next_cursor_id` back as
+    `before_ts`/`before_id` to fetch the next page without the cost of
+    OFFSET scans; `total` is only computed on the first (cursor-less)
+    page.
     """
-    offset = (page - 1) * page_size
-
-    # Get total count
-    total = db.query(ScanResult).filter(
-        ScanResult.user_id_hash == user_id_hash
-    ).count()
-
-    # Get scans for current page
-    scans = db.query(ScanResult).filter(
-        ScanResult.user_id_hash == user_id_hash
-    ).order_by(desc(ScanResult.timestamp)).offset(offset).limit(page_size).all()
+    # Only load the columns the response needs - skips content_hash,
+    # counter_evidence and audit columns on every row. raiseload guards
+    # against any future relationship silently lazy-loading per row (N+1).
+    query = select(ScanResult).options(raiseload('*'), load_only(
+        ScanResult.content_preview,
+        ScanResult.content_type,
+        ScanResult.verdict,
+        ScanResult.credibility_score,
+        ScanResult.confidence,
+        ScanResult.timestamp,
+        ScanResult.source_app,
+        ScanResult.sources,
+        ScanResult.explanation_summary,
+        ScanResult.explanation_reasons,
+        ScanResult.processing_tier,
+        ScanResult.processing_time_ms,
+        ScanResult.cached
+    )).where(ScanResult.user_id_hash == user_id_hash)
+
+    if before_ts is not None:
+        # Keyset pagination: index seek on (user_id_hash, timestamp),
+        # no COUNT(*) and no OFFSET scan
+        total = None
+        # Cursors minted before the switch to microseconds were
+        # millisecond-precision
+        if before_ts < 10 ** 14:
+            before_ts *= 1000
+        # Rebuild the exact datetime from integer seconds + microseconds
+        # so no float rounding creeps into the boundary comparison. The
+        # cursor is an absolute epoch value, so the boundary must be
+        # tz-aware UTC - a naive fromtimestamp() is local wall-clock and
+        # shifts the boundary by the host's UTC offset
+        boundary = datetime.fromtimestamp(
+            before_ts // 1_000_000, tz=timezone.utc
+        ).replace(microsecond=before_ts % 1_000_000)
+        if before_id is not None:
+            # Tuple keyset on (timestamp, id): rows sharing the boundary
+            # row's timestamp land on the next page instead of being
+            # skipped
+            query = query.where(
+                tuple_(ScanResult.timestamp, ScanResult.id) < (boundary, before_id)
+            )
+        else:
+            query = query.where(ScanResult.timestamp < boundary)
+    else:
+        # First page: report the total once
+        total = (await db.execute(
+            select(func.count()).select_from(ScanResult).where(
+                ScanResult.user_id_hash == user_id_hash
+            )
+        )).scalar()
+        if page > 1:
+            # Legacy offset paging still supported for old clients
+            query = query.offset((page - 1) * page_size)
+
+    # Fetch one extra row to know whether another page exists; id breaks
+    # ties so ordering is total and matches the cursor comparison
+    scans = (await db.execute(
+        query.order_by(desc(ScanResult.timestamp), desc(ScanResult.id))
+        .limit(page_size + 1)
+    )).scalars().all()
+
+    next_cursor = None
+    next_cursor_id = None
+    if len(scans) > page_size:
+        scans = scans[:page_size]
+        last = scans[-1]
+        last_ts = last.timestamp
+        if last_ts.tzinfo is None:
+            # asyncpg returns the timezone=True column tz-aware; SQLite
+            # (tests) round-trips it naive in UTC wall-clock. Naive
+            # .timestamp() would read it as local time and skew the
+            # cursor by the host's UTC offset.
+            last_ts = last_ts.replace(tzinfo=timezone.utc)
+        # Integer seconds * 1e6 + microseconds round-trips the column
+        # exactly (millisecond truncation used to drop rows that shared
+        # the boundary row's millisecond)
+        next_cursor = int(last_ts.timestamp()) * 1_000_000 + last_ts.microsecond
+        next_cursor_id = last.id
 
     # Convert to response format
     scan_responses = []
     for scan in scans:
         scan_responses.append(AnalyzeResponse(
             id=scan.id,
-            content=scan.content,
+            content=scan.content_preview or "",
             content_type=scan.content_type,
             verdict=scan.verdict,
             credibility_score=scan.credibility_score,
@@ -109,15 +230,17 @@ def get_scan_history(
         scans=scan_responses,
         total=total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        next_cursor=next_cursor,
+        next_cursor_id=next_cursor_id
     )
 
 
 @router.get("/stats", response_model=StatsResponse, tags=["Statistics"])
-def get_user_stats(
+async def get_user_stats(
     user_id_hash: str = Query(..., description="Hashed user identifier"),
     days: int = Query(30, ge=1, le=365, description="Number of days to include"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get user statistics
@@ -132,13 +255,20 @@ def get_user_stats(
     # Date range
     start_date = datetime.now() - timedelta(days=days)
 
-    # Get all scans in range
-    scans = db.query(ScanResult).filter(
+    in_range = (
         ScanResult.user_id_hash == user_id_hash,
         ScanResult.timestamp >= start_date
-    ).all()
+    )
 
-    total_scans = len(scans)
+    # Aggregate counts, average score, and verdict breakdown in SQL
+    # so only small aggregate rows cross the wire (not full scan rows)
+    verdict_rows = (await db.execute(
+        select(ScanResult.verdict, func.count(), func.avg(ScanResult.credibility_score))
+        .where(*in_range)
+        .group_by(ScanResult.verdict)
+    )).all()
+
+    total_scans = sum(count for _, count, _ in verdict_rows)
 
     if total_scans == 0:
         return StatsResponse(
@@ -152,30 +282,35 @@ def get_user_stats(
         )
 
     # Count by verdict
-    verified_count = len([s for s in scans if s.verdict == 'VERIFIED'])
-    unclear_count = len([s for s in scans if s.verdict == 'UNCLEAR'])
-    fake_count = len([s for s in scans if s.verdict in ['LIKELY_FAKE', 'CONFIRMED_FAKE']])
-
-    # Average score
-    avg_score = sum(s.credibility_score for s in scans) / total_scans
-
-    # Scans by day
-    scans_by_day = {}
-    for scan in scans:
-        date_key = scan.timestamp.strftime('%Y-%m-%d')
-        scans_by_day[date_key] = scans_by_day.get(date_key, 0) + 1
-
-    # Top sources
-    source_counts = {}
-    for scan in scans:
-        if scan.sources:
-            for source in scan.sources:
-                name = source.get('name', 'Unknown')
-                source_counts[name] = source_counts.get(name, 0) + 1
-
+    verdict_counts = {verdict: count for verdict, count, _ in verdict_rows}
+    verified_count = verdict_counts.get('VERIFIED', 0)
+    unclear_count = verdict_counts.get('UNCLEAR', 0)
+    fake_count = verdict_counts.get('LIKELY_FAKE', 0) + verdict_counts.get('CONFIRMED_FAKE', 0)
+
+    # Average score (weighted across verdict groups)
+    avg_score = sum(count * avg for _, count, avg in verdict_rows) / total_scans
+
+    # Scans by day (grouped in SQL)
+    day_rows = (await db.execute(
+        select(func.date_trunc('day', ScanResult.timestamp), func.count())
+        .where(*in_range)
+        .group_by(func.date_trunc('day', ScanResult.timestamp))
+    )).all()
+    scans_by_day = {day.strftime('%Y-%m-%d'): count for day, count in day_rows}
+
+    # Top sources - only the JSON sources column is fetched, not full rows
+    source_rows = (await db.execute(
+        select(ScanResult.sources).where(*in_range, ScanResult.sources.isnot(None))
+    )).scalars().all()
+
+    source_counter = Counter(
+        source.get('name', 'Unknown')
+        for sources in source_rows
+        for source in sources or []
+    )
     top_sources = [
         {'name': name, 'count': count}
-        for name, count in sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        for name, count in source_counter.most_common(5)
     ]
 
     return StatsResponse(
@@ -190,10 +325,10 @@ def get_user_stats(
 
 
 @router.post("/feedback", tags=["Feedback"])
-def submit_feedback(
+async def submit_feedback(
     feedback: FeedbackRequest,
     user_id_hash: str = Query("anonymous", description="Hashed user identifier"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Submit feedback on a scan result
@@ -201,27 +336,28 @@ def submit_feedback(
     Allows users to provide feedback on the accuracy of scan results.
     This helps improve the system over time.
     """
-    # Verify scan exists
-    scan = db.query(ScanResult).filter(ScanResult.id == feedback.scan_id).first()
-    if not scan:
+    # Verify scan exists - EXISTS avoids hydrating the full row
+    # (including the content TEXT) just to check presence
+    scan_exists = (await db.execute(
+        select(exists().where(ScanResult.id == feedback.scan_id))
+    )).scalar()
+    if not scan_exists:
         raise HTTPException(status_code=404, detail="Scan not found")
 
-    # Create feedback record
-    feedback_record = UserFeedback(
+    # Core insert: append-only write, no ORM unit-of-work overhead
+    await db.execute(insert(UserFeedback).values(
         scan_id=feedback.scan_id,
         user_id_hash=user_id_hash,
         feedback_type=feedback.feedback_type,
         comment=feedback.comment
-    )
-
-    db.add(feedback_record)
-    db.commit()
+    ))
+    await db.commit()
 
     return {"status": "success", "message": "Feedback submitted successfully"}
 
 
 @router.get("/health", response_model=HealthResponse, tags=["System"])
-def health_check(db: Session = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_db)):
     """
     Health check endpoint
 
@@ -229,13 +365,13 @@ def health_check(db: Session = Depends(get_db)):
     """
     # Check database
     try:
-        db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 1"))
         db_status = "healthy"
     except Exception as e:
         db_status = f"unhealthy: {str(e)}"
 
     # Check Redis
-    redis_status = "healthy" if cache.is_healthy() else "unhealthy"
+    redis_status = "healthy" if await cache.is_healthy() else "unhealthy"
 
     return HealthResponse(
         status="healthy" if db_status == "healthy" else "degraded",
@@ -247,24 +383,24 @@ def health_check(db: Session = Depends(get_db)):
 
 
 @router.get("/cache/stats", tags=["System"])
-def get_cache_stats():
+async def get_cache_stats():
     """
     Get cache statistics
 
     Returns information about the Redis cache performance.
     """
-    return cache.get_stats()
+    return await cache.get_stats()
 
 
 @router.delete("/cache/clear", tags=["System"])
-def clear_cache():
+async def clear_cache():
     """
     Clear all cache entries
 
     **Warning:** This will clear all cached analysis results.
     Use with caution in production.
     """
-    if cache.clear_all():
+    if await cache.clear_all():
         return {"status": "success", "message": "Cache cleared"}
     else:
         raise HTTPException(status_code=500, detail="Failed to clear cache")
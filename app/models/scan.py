@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text, JSON, Boolean
+from sqlalchemy import Column, String, Integer, Float, DateTime, Text, JSON, Boolean, Index, LargeBinary
 from sqlalchemy.sql import func
 from app.db.database import Base
 import uuid
@@ -9,7 +9,10 @@ class ScanResult(Base):
     __tablename__ = "scan_results"
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    content = Column(Text, nullable=False)
+    # Raw content is stored zstd-compressed; the preview serves list
+    # views so hot queries never touch the large blob
+    content_preview = Column(String(256))
+    content_compressed = Column(LargeBinary)
     content_type = Column(String(20), nullable=False, default="text")
     content_hash = Column(String(64), nullable=False, index=True)
 
@@ -34,11 +37,18 @@ class ScanResult(Base):
 
     # Analytics
     cached = Column(Boolean, default=False)
-    user_id_hash = Column(String(64), index=True)  # Privacy: hashed user ID
+    user_id_hash = Column(String(64))  # Privacy: hashed user ID
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # History and stats filter by user and order/range on timestamp;
+    # the composite index covers both without a sort node. It replaces
+    # the old single-column user_id_hash index (redundant as a prefix).
+    __table_args__ = (
+        Index('ix_scan_user_ts', user_id_hash, timestamp.desc()),
+    )
+
 
 class SourceCredibility(Base):
     """Source credibility ratings"""
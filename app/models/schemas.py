@@ -52,9 +52,11 @@ class AnalyzeResponse(BaseModel):
 class ScanHistoryResponse(BaseModel):
     """Scan history response"""
     scans: List[AnalyzeResponse]
-    total: int
+    total: Optional[int] = None  # Only computed on the first (cursor-less) page
     page: int
     page_size: int
+    next_cursor: Optional[int] = None  # Microsecond timestamp; pass back as before_ts
+    next_cursor_id: Optional[str] = None  # Tiebreaker id; pass back as before_id
 
 
 class StatsResponse(BaseModel):
@@ -3,17 +3,28 @@ Main Analysis Service
 Orchestrates text analysis, fact checking, and result generation
 """
 
+import asyncio
 import time
 from typing import Dict
 from datetime import datetime
-from sqlalchemy.orm import Session
+from fastapi import BackgroundTasks
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.text_analyzer import text_analyzer
 from app.services.fact_checker import fact_checker
 from app.services.cache import cache
+from app.services.compression import compress_text
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
 from app.models.scan import ScanResult, KnownFake
 from app.models.schemas import AnalyzeResponse, Source, Explanation
 
+# Bound once at import - settings are frozen and these sit on the
+# per-request persistence path
+_TTL_DIRECT = settings.CACHE_TTL_DIRECT
+_TTL_FAILOVER = settings.CACHE_TTL_FAILOVER
+
 
 class AnalyzerService:
     """Main service for analyzing content"""
@@ -24,7 +35,8 @@ class AnalyzerService:
         content_type: str,
         source_app: str,
         user_id_hash: str,
-        db: Session
+        db: AsyncSession,
+        background: BackgroundTasks
     ) -> AnalyzeResponse:
         """
         Analyze content and return credibility assessment
@@ -34,57 +46,130 @@ class AnalyzerService:
         # Generate content hash
         content_hash = text_analyzer.generate_hash(content)
 
-        # Check cache first
-        cache_key = f"scan:{content_hash}"
-        cached_result = cache.get(cache_key)
+        # Check cache and the known-fake registry concurrently - both
+        # key on content_hash and are independent, so overlap the RTTs
+        direct_key = f"scan:direct:{content_hash}"
+        failover_key = f"scan:failover:{content_hash}"
+        cached_result, known_fake_result = await asyncio.gather(
+            cache.get(direct_key),
+            db.execute(select(KnownFake).where(KnownFake.content_hash == content_hash))
+        )
+
         if cached_result:
             cached_result['cached'] = True
             cached_result['processing_time_ms'] = int((time.time() - start_time) * 1000)
-            return AnalyzeResponse(**cached_result)
+            # Cache data was validated before it was stored - skip
+            # re-running full Pydantic validation on the hot hit path
+            return AnalyzeResponse.model_construct(**cached_result)
 
-        # Check if content is known fake
-        known_fake = db.query(KnownFake).filter(
-            KnownFake.content_hash == content_hash
-        ).first()
+        known_fake = known_fake_result.scalars().first()
 
+        lock_key = None
         if known_fake:
             # Return immediate fake verdict
             result = self._create_known_fake_response(
                 content, content_hash, source_app, start_time
             )
         else:
-            # Perform full analysis
-            result = await self._perform_analysis(
-                content, content_hash, content_type, source_app, start_time, db
-            )
-
-        # Save to database
-        scan_record = ScanResult(
-            id=result['id'],
-            content=content,
-            content_type=content_type,
-            content_hash=content_hash,
-            verdict=result['verdict'],
-            credibility_score=result['credibility_score'],
-            confidence=result['confidence'],
-            timestamp=datetime.fromtimestamp(result['timestamp'] / 1000),
-            source_app=source_app,
-            processing_tier=result['processing_tier'],
-            processing_time_ms=result['processing_time_ms'],
-            explanation_summary=result['explanation']['summary'],
-            explanation_reasons=result['explanation']['reasons'],
-            sources=[dict(s) for s in result['sources']],
-            cached=result['cached'],
-            user_id_hash=user_id_hash
+            # Single-flight: if another request is already analyzing the
+            # same content, wait for its cached result instead of running
+            # the expensive pipeline twice (viral content is exactly this)
+            lock_key = f"lock:scan:{content_hash}"
+            if not await cache.acquire_lock(lock_key, ttl=30):
+                lock_key = None  # lock belongs to the other request
+                in_flight = await self._await_in_flight(direct_key, start_time)
+                if in_flight is not None:
+                    return in_flight
+
+            try:
+                # Perform full analysis
+                result = await self._perform_analysis(
+                    content, content_hash, content_type, source_app, start_time, db
+                )
+            except Exception:
+                if lock_key:
+                    await cache.release_lock(lock_key)
+                # Analyzer pipeline failed (e.g. fact-check APIs down) -
+                # serve a stale result from the long-TTL failover tier
+                stale_result = await cache.get(failover_key)
+                if stale_result:
+                    stale_result['cached'] = True
+                    stale_result['processing_time_ms'] = int((time.time() - start_time) * 1000)
+                    return AnalyzeResponse.model_construct(**stale_result)
+                raise
+
+        # Persist and cache after the response is on the wire - the
+        # client doesn't wait for the INSERT commit or the Redis write
+        background.add_task(
+            self._persist_scan, result, direct_key, failover_key,
+            content_hash, user_id_hash, lock_key
         )
-        db.add(scan_record)
-        db.commit()
-
-        # Cache the result
-        cache.set(cache_key, result, ttl=3600)  # 1 hour
 
         return AnalyzeResponse(**result)
 
+    async def _await_in_flight(
+        self,
+        direct_key: str,
+        start_time: float
+    ) -> "AnalyzeResponse | None":
+        """Poll the cache for a concurrent analysis of the same content
+
+        Returns None if no result appears within ~5s, in which case the
+        caller should run the analysis itself.
+        """
+        for _ in range(100):
+            await asyncio.sleep(0.05)
+            result = await cache.get(direct_key)
+            if result:
+                result['cached'] = True
+                result['processing_time_ms'] = int((time.time() - start_time) * 1000)
+                return AnalyzeResponse.model_construct(**result)
+        return None
+
+    async def _persist_scan(
+        self,
+        result: Dict,
+        direct_key: str,
+        failover_key: str,
+        content_hash: str,
+        user_id_hash: str,
+        lock_key: str = None
+    ) -> None:
+        """Write the scan result to cache and database (background task)"""
+        # Cache first so concurrent duplicates hit it as soon as possible:
+        # short-TTL direct tier for freshness, long-TTL failover tier for
+        # resilience when the analyzer pipeline is down
+        await asyncio.gather(
+            cache.set(direct_key, result, ttl=_TTL_DIRECT),
+            cache.set(failover_key, result, ttl=_TTL_FAILOVER)
+        )
+        if lock_key:
+            # Waiters can now read the cached result
+            await cache.release_lock(lock_key)
+
+        async with AsyncSessionLocal() as db:
+            # Core insert: append-only write, no ORM unit-of-work overhead
+            await db.execute(insert(ScanResult).values(
+                id=result['id'],
+                content_preview=result['content'][:256],
+                content_compressed=compress_text(result['content']),
+                content_type=result['content_type'],
+                content_hash=content_hash,
+                verdict=result['verdict'],
+                credibility_score=result['credibility_score'],
+                confidence=result['confidence'],
+                timestamp=datetime.fromtimestamp(result['timestamp'] / 1000),
+                source_app=result['source_app'],
+                processing_tier=result['processing_tier'],
+                processing_time_ms=result['processing_time_ms'],
+                explanation_summary=result['explanation']['summary'],
+                explanation_reasons=result['explanation']['reasons'],
+                sources=[dict(s) for s in result['sources']],
+                cached=result['cached'],
+                user_id_hash=user_id_hash
+            ))
+            await db.commit()
+
     async def _perform_analysis(
         self,
         content: str,
@@ -92,15 +177,17 @@ class AnalyzerService:
         content_type: str,
         source_app: str,
         start_time: float,
-        db: Session
+        db: AsyncSession
     ) -> Dict:
         """Perform full text analysis and fact checking"""
 
-        # Run text analysis
-        text_analysis = text_analyzer.analyze(content)
-
-        # Run fact checking
-        fact_check_results = await fact_checker.check_facts(content)
+        # Run the CPU-bound text analysis in a worker thread so it can't
+        # block the event loop, and overlap it with the fact-check API
+        # round-trips - the slower of the two sets the latency floor
+        text_analysis, fact_check_results = await asyncio.gather(
+            asyncio.to_thread(text_analyzer.analyze, content),
+            fact_checker.check_facts(content)
+        )
 
         # Combine results
         credibility_score = text_analysis['credibility_score']
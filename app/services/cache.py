@@ -3,24 +3,37 @@ Redis Cache Service
 Provides caching for analysis results
 """
 
-import redis
-import json
+import logging
+import redis.asyncio as redis
+import orjson
 from typing import Optional, Dict
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Settings attribute access goes through Pydantic's descriptor protocol;
+# bind the per-call default once at import (settings are frozen)
+_CACHE_TTL_DEFAULT = settings.CACHE_TTL
+
 
 class CacheService:
-    """Redis-based caching service"""
+    """Redis-based caching service (async client)"""
 
     def __init__(self):
-        """Initialize Redis connection"""
+        """Initialize Redis connection
+
+        The async client connects lazily on first command, so failures
+        surface per-call rather than at import time.
+        """
         try:
             # Use REDIS_URL if provided (Railway), otherwise use individual settings (local)
             if settings.REDIS_URL:
                 self.redis_client = redis.from_url(
                     settings.REDIS_URL,
-                    decode_responses=True,
-                    socket_connect_timeout=2
+                    decode_responses=False,  # orjson works on raw bytes
+                    socket_connect_timeout=2,
+                    socket_keepalive=True,
+                    max_connections=settings.REDIS_MAX_CONNECTIONS
                 )
             else:
                 self.redis_client = redis.Redis(
@@ -28,80 +41,123 @@ class CacheService:
                     port=settings.REDIS_PORT,
                     db=settings.REDIS_DB,
                     password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
-                    decode_responses=True,
-                    socket_connect_timeout=2
+                    decode_responses=False,  # orjson works on raw bytes
+                    socket_connect_timeout=2,
+                    socket_keepalive=True,
+                    max_connections=settings.REDIS_MAX_CONNECTIONS
                 )
-            # Test connection
-            self.redis_client.ping()
             self.enabled = settings.ENABLE_CACHING
         except Exception as e:
-            print(f"Redis connection failed: {e}. Caching disabled.")
+            logger.warning("Redis client setup failed: %s. Caching disabled.", e)
             self.redis_client = None
             self.enabled = False
-
-    def get(self, key: str) -> Optional[Dict]:
+        self._error_count = 0
+
+    def _log_error(self, operation: str, exc: Exception) -> None:
+        """Log a cache error with sampling
+
+        When Redis is degraded every call fails; log the first few errors
+        in full, then 1 in 100, so a broken Redis node doesn't serialize
+        all workers on stderr.
+        """
+        self._error_count += 1
+        if self._error_count <= 10 or self._error_count % 100 == 0:
+            logger.warning(
+                "Cache %s error (%d so far): %s", operation, self._error_count, exc
+            )
+
+    async def get(self, key: str) -> Optional[Dict]:
         """Get cached value"""
         if not self.enabled or not self.redis_client:
             return None
 
         try:
-            value = self.redis_client.get(key)
+            value = await self.redis_client.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
         except Exception as e:
-            print(f"Cache get error: {e}")
+            self._log_error("get", e)
 
         return None
 
-    def set(self, key: str, value: Dict, ttl: int = None) -> bool:
+    async def set(self, key: str, value: Dict, ttl: int = None) -> bool:
         """Set cache value with optional TTL"""
         if not self.enabled or not self.redis_client:
             return False
 
         try:
-            ttl = ttl or settings.CACHE_TTL
-            serialized = json.dumps(value)
-            self.redis_client.setex(key, ttl, serialized)
+            ttl = ttl or _CACHE_TTL_DEFAULT
+            serialized = orjson.dumps(value)  # bytes out, no extra encode
+            await self.redis_client.setex(key, ttl, serialized)
             return True
         except Exception as e:
-            print(f"Cache set error: {e}")
+            self._log_error("set", e)
             return False
 
-    def delete(self, key: str) -> bool:
+    async def acquire_lock(self, key: str, ttl: int = 30) -> bool:
+        """Try to acquire a short-lived lock via SET NX
+
+        Returns True when the lock was acquired (or caching is disabled,
+        in which case callers should just proceed).
+        """
+        if not self.enabled or not self.redis_client:
+            return True
+
+        try:
+            return bool(await self.redis_client.set(key, b"1", nx=True, ex=ttl))
+        except Exception as e:
+            self._log_error("lock", e)
+            return True
+
+    async def release_lock(self, key: str) -> None:
+        """Release a lock acquired with acquire_lock"""
+        if not self.enabled or not self.redis_client:
+            return
+
+        try:
+            await self.redis_client.delete(key)
+        except Exception as e:
+            self._log_error("unlock", e)
+
+    async def delete(self, key: str) -> bool:
         """Delete cache entry"""
         if not self.enabled or not self.redis_client:
             return False
 
         try:
-            self.redis_client.delete(key)
+            await self.redis_client.delete(key)
             return True
         except Exception as e:
-            print(f"Cache delete error: {e}")
+            self._log_error("delete", e)
             return False
 
-    def clear_all(self) -> bool:
+    async def clear_all(self) -> bool:
         """Clear all cache (use with caution)"""
         if not self.enabled or not self.redis_client:
             return False
 
         try:
-            self.redis_client.flushdb()
+            await self.redis_client.flushdb()
             return True
         except Exception as e:
-            print(f"Cache clear error: {e}")
+            self._log_error("clear", e)
             return False
 
-    def get_stats(self) -> Dict:
+    async def get_stats(self) -> Dict:
         """Get cache statistics"""
         if not self.enabled or not self.redis_client:
             return {'enabled': False}
 
         try:
-            info = self.redis_client.info()
+            # Pipeline INFO + DBSIZE into a single round-trip
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.info()
+                pipe.dbsize()
+                info, keys = await pipe.execute()
             return {
                 'enabled': True,
                 'connected': True,
-                'keys': self.redis_client.dbsize(),
+                'keys': keys,
                 'memory_used': info.get('used_memory_human', 'N/A'),
                 'hits': info.get('keyspace_hits', 0),
                 'misses': info.get('keyspace_misses', 0)
@@ -109,13 +165,13 @@ class CacheService:
         except Exception as e:
             return {'enabled': True, 'connected': False, 'error': str(e)}
 
-    def is_healthy(self) -> bool:
+    async def is_healthy(self) -> bool:
         """Check if cache is healthy"""
         if not self.enabled or not self.redis_client:
             return False
 
         try:
-            return self.redis_client.ping()
+            return await self.redis_client.ping()
         except:
             return False
 
@@ -0,0 +1,20 @@
+"""
+Content Compression Helpers
+zstd compression for stored scan content
+"""
+
+import zstandard
+
+# Level 3 is the zstd default sweet spot: ~3-5x on text at high speed
+_compressor = zstandard.ZstdCompressor(level=3)
+_decompressor = zstandard.ZstdDecompressor()
+
+
+def compress_text(text: str) -> bytes:
+    """Compress text for storage"""
+    return _compressor.compress(text.encode())
+
+
+def decompress_text(data: bytes) -> str:
+    """Decompress stored text"""
+    return _decompressor.decompress(data).decode()
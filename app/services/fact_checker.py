@@ -4,11 +4,83 @@ Integrates with external fact-checking APIs and databases
 """
 
 import httpx
+import logging
+import re
+import sys
 from typing import List, Dict, Optional
 from app.core.config import settings
 from app.models.schemas import Source
 import asyncio
 
+logger = logging.getLogger(__name__)
+
+# Compiled once: tokenizer for keyless-mode content classification
+_WORD_RE = re.compile(r'\w+')
+
+# Mock source lists for _get_mock_sources, built once instead of as
+# fresh literals on every keyless request
+_MOCK_CLIMATE_SOURCES = [
+    {
+        'name': 'Reuters',
+        'url': 'https://reuters.com/environment',
+        'credibility_rating': 0.95,
+        'agrees_with_content': True
+    },
+    {
+        'name': 'BBC News',
+        'url': 'https://bbc.com/news/science-environment',
+        'credibility_rating': 0.93,
+        'agrees_with_content': True
+    }
+]
+
+_MOCK_TECH_SOURCES = [
+    {
+        'name': 'TechCrunch',
+        'url': 'https://techcrunch.com',
+        'credibility_rating': 0.88,
+        'agrees_with_content': True
+    },
+    {
+        'name': 'The Verge',
+        'url': 'https://theverge.com',
+        'credibility_rating': 0.85,
+        'agrees_with_content': True
+    }
+]
+
+_MOCK_HEALTH_SOURCES = [
+    {
+        'name': 'Medical Journal',
+        'url': 'https://example.com/medical',
+        'credibility_rating': 0.75,
+        'agrees_with_content': None
+    }
+]
+
+_MOCK_GENERIC_SOURCES = [
+    {
+        'name': 'Reuters',
+        'url': 'https://reuters.com',
+        'credibility_rating': 0.95,
+        'agrees_with_content': None
+    },
+    {
+        'name': 'AP News',
+        'url': 'https://apnews.com',
+        'credibility_rating': 0.94,
+        'agrees_with_content': None
+    }
+]
+
+# Shared client: keep-alive connections avoid a fresh TCP+TLS handshake
+# to the fact-check APIs on every request. Closed in main.py's shutdown.
+_client = httpx.AsyncClient(
+    http2=True,
+    timeout=5.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+)
+
 
 class FactChecker:
     """Integrates with fact-checking APIs and news sources"""
@@ -28,6 +100,12 @@ class FactChecker:
         'cbsnews.com': 0.80,
     }
 
+    # Keyword sets for classifying keyless-mode content; set intersection
+    # against the tokenized text replaces per-keyword substring scans
+    _CLIMATE_KW = frozenset({'climate', 'environment', 'carbon', 'emissions'})
+    _TECH_KW = frozenset({'tech', 'technology', 'ai', 'software'})
+    _HEALTH_KW = frozenset({'health', 'medical', 'study', 'research'})
+
     def __init__(self):
         self.google_api_key = settings.GOOGLE_FACT_CHECK_API_KEY
         self.news_api_key = settings.NEWS_API_KEY
@@ -39,15 +117,21 @@ class FactChecker:
         """
         sources = []
 
-        # Try Google Fact Check API if available
+        # Query the configured APIs concurrently - total latency becomes
+        # max(t_google, t_news) instead of the sum
+        tasks = []
         if self.google_api_key:
-            google_results = await self._check_google_fact_check(text)
-            sources.extend(google_results)
-
-        # Try News API if available
+            tasks.append(self._check_google_fact_check(text))
         if self.news_api_key:
-            news_results = await self._search_news_api(text)
-            sources.extend(news_results)
+            tasks.append(self._search_news_api(text))
+
+        if tasks:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning("Fact check source error: %s", result)
+                else:
+                    sources.extend(result)
 
         # If no API keys, return mock trusted sources
         if not sources:
@@ -62,74 +146,73 @@ class FactChecker:
     async def _check_google_fact_check(self, text: str) -> List[Dict]:
         """Check Google Fact Check Tools API"""
         try:
-            async with httpx.AsyncClient() as client:
-                url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
-                params = {
-                    'key': self.google_api_key,
-                    'query': text[:500],  # Limit query length
-                    'languageCode': 'en'
-                }
-                response = await client.get(url, params=params, timeout=5.0)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    sources = []
-
-                    for claim in data.get('claims', [])[:3]:  # Limit to 3
-                        for review in claim.get('claimReview', []):
-                            sources.append({
-                                'name': review.get('publisher', {}).get('name', 'Unknown'),
-                                'url': review.get('url', ''),
-                                'credibility_rating': self._get_publisher_credibility(
-                                    review.get('publisher', {}).get('site', '')
-                                ),
-                                'agrees_with_content': self._rating_to_agreement(
-                                    review.get('textualRating', '')
-                                )
-                            })
-
-                    return sources
+            url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+            params = {
+                'key': self.google_api_key,
+                'query': text[:500],  # Limit query length
+                'languageCode': 'en'
+            }
+            response = await _client.get(url, params=params)
+
+            if response.status_code == 200:
+                data = response.json()
+                sources = []
+
+                for claim in data.get('claims', [])[:3]:  # Limit to 3
+                    for review in claim.get('claimReview', []):
+                        sources.append({
+                            'name': review.get('publisher', {}).get('name', 'Unknown'),
+                            'url': review.get('url', ''),
+                            'credibility_rating': self._get_publisher_credibility(
+                                review.get('publisher', {}).get('site', '')
+                            ),
+                            'agrees_with_content': self._rating_to_agreement(
+                                review.get('textualRating', '')
+                            )
+                        })
+
+                return sources
         except Exception as e:
-            print(f"Google Fact Check API error: {e}")
+            logger.warning("Google Fact Check API error: %s", e)
 
         return []
 
     async def _search_news_api(self, text: str) -> List[Dict]:
         """Search for news articles about the claim"""
         try:
-            # Extract key phrases (simple approach - first 50 words)
-            words = text.split()[:50]
-            query = ' '.join(words)
-
-            async with httpx.AsyncClient() as client:
-                url = "https://newsapi.org/v2/everything"
-                params = {
-                    'apiKey': self.news_api_key,
-                    'q': query,
-                    'language': 'en',
-                    'sortBy': 'relevancy',
-                    'pageSize': 5
-                }
-                response = await client.get(url, params=params, timeout=5.0)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    sources = []
-
-                    for article in data.get('articles', [])[:3]:
-                        source_url = article.get('url', '')
-                        domain = self._extract_domain(source_url)
+            # Extract key phrases (simple approach - first 50 words).
+            # maxsplit stops the C-level tokenizer after 50 words instead
+            # of splitting the entire article and slicing afterwards
+            query = ' '.join(text.split(maxsplit=50)[:50])
 
-                        sources.append({
-                            'name': article.get('source', {}).get('name', 'Unknown'),
-                            'url': source_url,
-                            'credibility_rating': self.TRUSTED_SOURCES.get(domain, 0.6),
-                            'agrees_with_content': None  # Can't determine without content analysis
-                        })
+            url = "https://newsapi.org/v2/everything"
+            params = {
+                'apiKey': self.news_api_key,
+                'q': query,
+                'language': 'en',
+                'sortBy': 'relevancy',
+                'pageSize': 5
+            }
+            response = await _client.get(url, params=params)
 
-                    return sources
+            if response.status_code == 200:
+                data = response.json()
+                sources = []
+
+                for article in data.get('articles', [])[:3]:
+                    source_url = article.get('url', '')
+                    domain = self._extract_domain(source_url)
+
+                    sources.append({
+                        'name': article.get('source', {}).get('name', 'Unknown'),
+                        'url': source_url,
+                        'credibility_rating': _TRUSTED.get(domain, 0.6),
+                        'agrees_with_content': None  # Can't determine without content analysis
+                    })
+
+                return sources
         except Exception as e:
-            print(f"News API error: {e}")
+            logger.warning("News API error: %s", e)
 
         return []
 
@@ -138,84 +221,47 @@ class FactChecker:
         Generate mock sources based on text content
         This is a fallback when no API keys are available
         """
-        text_lower = text.lower()
-        sources = []
+        # Tokenize once; each category check is then a handful of hash
+        # probes instead of substring scans over the whole text
+        words = frozenset(_WORD_RE.findall(text.lower()))
 
         # Determine type of content and return appropriate sources
-        if any(word in text_lower for word in ['climate', 'environment', 'carbon', 'emissions']):
-            sources = [
-                {
-                    'name': 'Reuters',
-                    'url': 'https://reuters.com/environment',
-                    'credibility_rating': 0.95,
-                    'agrees_with_content': True
-                },
-                {
-                    'name': 'BBC News',
-                    'url': 'https://bbc.com/news/science-environment',
-                    'credibility_rating': 0.93,
-                    'agrees_with_content': True
-                }
-            ]
-        elif any(word in text_lower for word in ['tech', 'technology', 'ai', 'software']):
-            sources = [
-                {
-                    'name': 'TechCrunch',
-                    'url': 'https://techcrunch.com',
-                    'credibility_rating': 0.88,
-                    'agrees_with_content': True
-                },
-                {
-                    'name': 'The Verge',
-                    'url': 'https://theverge.com',
-                    'credibility_rating': 0.85,
-                    'agrees_with_content': True
-                }
-            ]
-        elif any(word in text_lower for word in ['health', 'medical', 'study', 'research']):
-            sources = [
-                {
-                    'name': 'Medical Journal',
-                    'url': 'https://example.com/medical',
-                    'credibility_rating': 0.75,
-                    'agrees_with_content': None
-                }
-            ]
+        if words & self._CLIMATE_KW:
+            sources = _MOCK_CLIMATE_SOURCES
+        elif words & self._TECH_KW:
+            sources = _MOCK_TECH_SOURCES
+        elif words & self._HEALTH_KW:
+            sources = _MOCK_HEALTH_SOURCES
         else:
             # Generic trusted sources
-            sources = [
-                {
-                    'name': 'Reuters',
-                    'url': 'https://reuters.com',
-                    'credibility_rating': 0.95,
-                    'agrees_with_content': None
-                },
-                {
-                    'name': 'AP News',
-                    'url': 'https://apnews.com',
-                    'credibility_rating': 0.94,
-                    'agrees_with_content': None
-                }
-            ]
-
-        return sources
+            sources = _MOCK_GENERIC_SOURCES
+
+        return list(sources)
 
     def _get_publisher_credibility(self, site: str) -> float:
         """Get credibility rating for a publisher"""
         domain = self._extract_domain(site)
-        return self.TRUSTED_SOURCES.get(domain, 0.7)
+        return _TRUSTED.get(domain, 0.7)
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL"""
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            domain = parsed.netloc or parsed.path
-            # Remove www.
-            domain = domain.replace('www.', '')
-            return domain
-        except:
-            return url
+        # Direct string slicing: urlparse builds a full ParseResult (and
+        # was imported inside the function) just to read netloc, and this
+        # runs for every article and publisher in a response
+        i = url.find('://')
+        start = i + 3 if i != -1 else 0
+        end = len(url)
+        for ch in ('/', '?', '#', ':'):
+            j = url.find(ch, start)
+            if j != -1 and j < end:
+                end = j
+        host = url[start:end]
+        # Remove www.
+        if host.startswith('www.'):
+            host = host[4:]
+        # Interned hosts make the _TRUSTED lookup an identity compare
+        # for the domains we actually know about
+        return sys.intern(host)
 
     def _rating_to_agreement(self, rating: str) -> Optional[bool]:
         """Convert textual rating to agreement boolean"""
@@ -229,5 +275,9 @@ class FactChecker:
             return None
 
 
+# Interned-key view of TRUSTED_SOURCES: lookups from _extract_domain
+# become identity compares instead of full string hashing per article
+_TRUSTED = {sys.intern(k): v for k, v in FactChecker.TRUSTED_SOURCES.items()}
+
 # Singleton instance
 fact_checker = FactChecker()
@@ -3,6 +3,10 @@ Pixel Pirates Backend - Main Application
 FastAPI server for misinformation detection
 """
 
+import anyio
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -11,6 +15,15 @@ import uvicorn
 from app.core.config import settings
 from app.api.routes import router
 from app.db.database import init_db
+from app.services.fact_checker import _client as fact_checker_client
+from app.services.text_analyzer import text_analyzer
+
+logger = logging.getLogger(__name__)
+
+# Handlers never block request threads: records go into an in-memory
+# queue and a listener thread does the actual (synchronous) writes
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
 
 # Create FastAPI app
 app = FastAPI(
@@ -37,24 +50,36 @@ app.include_router(router, prefix="/api/v1")
 @app.on_event("startup")
 async def startup_event():
     """Initialize on startup"""
-    print(f"🚀 Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-    print(f"📝 Environment: {settings.ENVIRONMENT}")
-    print(f"🔧 Debug mode: {settings.DEBUG}")
+    logging.basicConfig(handlers=[QueueHandler(_log_queue)], level=logging.INFO)
+    _log_listener.start()
+
+    logger.info("🚀 Starting %s v%s", settings.APP_NAME, settings.APP_VERSION)
+    logger.info("📝 Environment: %s", settings.ENVIRONMENT)
+    logger.info("🔧 Debug mode: %s", settings.DEBUG)
+
+    # Raise the anyio threadpool above its 40-slot default so residual
+    # sync work can't cap concurrency below the DB/Redis pool sizes
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_TOKENS
+
+    # Pay JIT compilation / lazy-import costs now, not on the first request
+    text_analyzer._warmup()
 
     # Initialize database
     try:
-        init_db()
-        print("✅ Database initialized")
+        await init_db()
+        logger.info("✅ Database initialized")
     except Exception as e:
-        print(f"❌ Database initialization failed: {e}")
+        logger.error("❌ Database initialization failed: %s", e)
 
-    print(f"📚 API Documentation: http://{settings.HOST}:{settings.PORT}/docs")
+    logger.info("📚 API Documentation: http://%s:%s/docs", settings.HOST, settings.PORT)
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
-    print("👋 Shutting down...")
+    await fact_checker_client.aclose()
+    logger.info("👋 Shutting down...")
+    _log_listener.stop()
 
 
 @app.get("/")
@@ -87,5 +112,7 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
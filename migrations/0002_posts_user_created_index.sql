@@ -0,0 +1,7 @@
+-- Composite index for the posts list query
+-- Migration: 0002_posts_user_created_index
+
+-- Lets WHERE user_id = ? ORDER BY created_at DESC LIMIT 20 run as a
+-- single index scan instead of filtering on idx_posts_user_id and then
+-- sorting the matching rows
+CREATE INDEX IF NOT EXISTS idx_posts_user_created ON posts(user_id, created_at DESC);
@@ -0,0 +1,25 @@
+-- Scan content storage rework for the FastAPI/Postgres backend
+-- Migration: postgres/0001_scan_content_compression
+-- (the .sql files one level up target the Workers D1 database)
+--
+-- The ORM replaced scan_results.content (TEXT NOT NULL) with a 256-char
+-- preview plus a zstd-compressed blob. init_db() only creates missing
+-- tables, so existing databases must apply this before deploying that
+-- model: without it every history SELECT fails on the missing columns
+-- and every insert violates the old NOT NULL constraint.
+
+ALTER TABLE scan_results ADD COLUMN IF NOT EXISTS content_preview VARCHAR(256);
+ALTER TABLE scan_results ADD COLUMN IF NOT EXISTS content_compressed BYTEA;
+
+-- Backfill previews from the legacy column
+UPDATE scan_results
+SET content_preview = LEFT(content, 256)
+WHERE content_preview IS NULL AND content IS NOT NULL;
+
+-- zstd compression is not available in SQL. To keep the full text of
+-- legacy rows, run
+--     python scripts/backfill_content_compression.py
+-- between the statements above and the DROP below; otherwise legacy
+-- rows keep only their 256-char preview (the API already falls back to
+-- it when content_compressed is NULL).
+ALTER TABLE scan_results DROP COLUMN IF EXISTS content;
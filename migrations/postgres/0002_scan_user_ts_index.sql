@@ -0,0 +1,12 @@
+-- Composite index for scan history and stats queries
+-- Migration: postgres/0002_scan_user_ts_index
+--
+-- Matches the ix_scan_user_ts declaration in the ORM model, which
+-- create_all only materializes on brand-new databases. CONCURRENTLY
+-- avoids blocking writes on a live table (run outside a transaction).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scan_user_ts
+    ON scan_results (user_id_hash, timestamp DESC);
+
+-- The old single-column index is a redundant prefix of the composite
+DROP INDEX CONCURRENTLY IF EXISTS ix_scan_results_user_id_hash;
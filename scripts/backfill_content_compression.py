@@ -0,0 +1,48 @@
+"""
+Backfill scan_results.content_compressed from the legacy content column
+
+Run between the ADD COLUMN and DROP COLUMN steps of
+migrations/postgres/0001_scan_content_compression.sql so legacy rows
+keep their full text. Raw SQL is used because the ORM model no longer
+maps the content column.
+
+Usage: python scripts/backfill_content_compression.py
+"""
+
+import asyncio
+
+from sqlalchemy import text
+
+from app.db.database import AsyncSessionLocal
+from app.services.compression import compress_text
+
+BATCH_SIZE = 500
+
+
+async def main() -> None:
+    backfilled = 0
+    async with AsyncSessionLocal() as db:
+        while True:
+            rows = (await db.execute(text(
+                "SELECT id, content FROM scan_results "
+                "WHERE content IS NOT NULL AND content_compressed IS NULL "
+                "LIMIT :n"
+            ), {"n": BATCH_SIZE})).all()
+            if not rows:
+                break
+
+            for scan_id, content in rows:
+                await db.execute(text(
+                    "UPDATE scan_results SET content_compressed = :blob "
+                    "WHERE id = :id"
+                ), {"blob": compress_text(content), "id": scan_id})
+            await db.commit()
+
+            backfilled += len(rows)
+            print(f"Backfilled {backfilled} rows...")
+
+    print(f"Done: {backfilled} rows compressed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,8 +4,33 @@ Adapted from FastAPI backend for Workers runtime
 """
 
 from js import Response, Headers, fetch
+import bcrypt
+import hashlib
 import json
 
+# CORS headers sent with every response. The JS Headers object is built
+# lazily on the first request and reused, instead of allocating a fresh
+# dict + Headers per call (browsers preflight constantly)
+_CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization",
+    "Content-Type": "application/json"
+}
+_cors_headers_js = None
+
+# Root endpoint body, serialized once per worker (env bindings are
+# constant for the lifetime of the isolate)
+_root_body = None
+
+
+def _cors_js():
+    """Shared JS Headers object for CORS responses (built on first use)"""
+    global _cors_headers_js
+    if _cors_headers_js is None:
+        _cors_headers_js = Headers.new(_CORS_HEADERS)
+    return _cors_headers_js
+
 
 async def on_fetch(request, env):
     """
@@ -16,26 +41,19 @@ async def on_fetch(request, env):
         env: Environment bindings (DB, CACHE, secrets)
     """
 
-    # Parse URL and method
-    url = request.url
-    method = request.method
-
-    # CORS headers
-    cors_headers = {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type, Authorization",
-        "Content-Type": "application/json"
-    }
-
-    # Handle CORS preflight
-    if method == "OPTIONS":
+    # Handle CORS preflight before any URL parsing or routing
+    if request.method == "OPTIONS":
         return Response.new(
             None,
             status=204,
-            headers=Headers.new(cors_headers)
+            headers=_cors_js()
         )
 
+    # Parse URL and method
+    url = request.url
+    method = request.method
+    cors_headers = _CORS_HEADERS
+
     # Route handling
     path = url.split('?')[0].split('/')[-1] if '/' in url else ''
 
@@ -44,15 +62,18 @@ async def on_fetch(request, env):
         if "health" in url:
             return json_response({"status": "healthy", "service": "Pixel Pirates API"}, cors_headers)
 
-        # Root endpoint
+        # Root endpoint (static per isolate - serialized once)
         if path == "" or "api" not in url:
-            return json_response({
-                "name": env.APP_NAME,
-                "version": env.APP_VERSION,
-                "status": "running",
-                "docs": "/docs",
-                "health": "/api/v1/health"
-            }, cors_headers)
+            global _root_body
+            if _root_body is None:
+                _root_body = json.dumps({
+                    "name": env.APP_NAME,
+                    "version": env.APP_VERSION,
+                    "status": "running",
+                    "docs": "/docs",
+                    "health": "/api/v1/health"
+                })
+            return Response.new(_root_body, status=200, headers=_cors_js())
 
         # Authentication endpoints
         if "auth" in url:
@@ -89,8 +110,11 @@ async def handle_auth(request, env, headers):
         if not data.get("email") or not data.get("password"):
             return json_response({"error": "Email and password required"}, headers, 400)
 
-        # Hash password (simplified - use proper hashing in production)
-        # In production, use a proper bcrypt library
+        # bcrypt runs in native code; cost 12 keeps hashing around the
+        # ~100ms target without starving the worker
+        hashed_password = bcrypt.hashpw(
+            data["password"].encode(), bcrypt.gensalt(rounds=12)
+        ).decode()
 
         # Insert into D1
         try:
@@ -99,7 +123,7 @@ async def handle_auth(request, env, headers):
             ).bind(
                 data.get("username", data["email"]),
                 data["email"],
-                f"hashed_{data['password']}"  # REPLACE WITH PROPER HASHING
+                hashed_password
             ).run()
 
             return json_response({
@@ -122,8 +146,11 @@ async def handle_auth(request, env, headers):
             if not result:
                 return json_response({"error": "Invalid credentials"}, headers, 401)
 
-            # Verify password (simplified)
-            # In production, use proper password verification
+            # Verify password against the stored bcrypt hash
+            if not bcrypt.checkpw(
+                data["password"].encode(), result["hashed_password"].encode()
+            ):
+                return json_response({"error": "Invalid credentials"}, headers, 401)
 
             # Generate token (simplified - use JWT in production)
             token = f"token_{result['id']}"
@@ -155,52 +182,65 @@ async def handle_analysis(request, env, headers):
         if not content:
             return json_response({"error": "Content required"}, headers, 400)
 
+        # Stable cache key: Python's hash() is seed-randomized per worker
+        # start, which would invalidate the whole KV cache on every
+        # deploy. Normalize whitespace/case so trivial variants share an
+        # entry.
+        normalized = ' '.join(content.lower().split())
+        cache_key = 'analysis_' + hashlib.sha256(normalized.encode()).hexdigest()[:32]
+
+        # Serve repeat analyses straight from KV
+        cached = await env.CACHE.get(cache_key)
+        if cached:
+            result = json.loads(cached)
+            result["cached"] = True
+            return json_response(result, headers)
+
         # Simple analysis (replace with actual AI/ML analysis)
         credibility_score = 0.75  # Placeholder
         is_misinformation = credibility_score < 0.5
 
-        # Cache result in KV
-        cache_key = f"analysis_{hash(content)}"
-        await env.CACHE.put(
-            cache_key,
-            json.dumps({
-                "credibility_score": credibility_score,
-                "is_misinformation": is_misinformation
-            }),
-            expiration_ttl=3600  # 1 hour
-        )
-
         # Store in D1
         user_id = data.get("user_id", 1)  # Get from auth token in production
 
-        # Insert post
-        post_result = await env.DB.prepare(
-            "INSERT INTO posts (user_id, content) VALUES (?, ?)"
-        ).bind(user_id, content).run()
-
-        post_id = post_result.meta.last_row_id
-
-        # Insert analysis
-        await env.DB.prepare(
-            """INSERT INTO analysis_results
-            (post_id, user_id, credibility_score, is_misinformation, confidence, analysis_type)
-            VALUES (?, ?, ?, ?, ?, ?)"""
-        ).bind(
-            post_id,
-            user_id,
-            credibility_score,
-            1 if is_misinformation else 0,
-            0.85,
-            "basic"
-        ).run()
-
-        return json_response({
+        # Insert post + analysis in one batched RPC instead of two
+        # sequential round-trips; the batch runs in a single transaction,
+        # so last_insert_rowid() resolves to the posts insert
+        results = await env.DB.batch([
+            env.DB.prepare(
+                "INSERT INTO posts (user_id, content) VALUES (?, ?)"
+            ).bind(user_id, content),
+            env.DB.prepare(
+                """INSERT INTO analysis_results
+                (post_id, user_id, credibility_score, is_misinformation, confidence, analysis_type)
+                VALUES (last_insert_rowid(), ?, ?, ?, ?, ?)"""
+            ).bind(
+                user_id,
+                credibility_score,
+                1 if is_misinformation else 0,
+                0.85,
+                "basic"
+            )
+        ])
+
+        post_id = results[0].meta.last_row_id
+
+        result = {
             "post_id": post_id,
             "credibility_score": credibility_score,
             "is_misinformation": is_misinformation,
             "confidence": 0.85,
             "recommendation": "Verify with additional sources" if is_misinformation else "Content appears credible"
-        }, headers)
+        }
+
+        # Cache the full response so repeats skip analysis and the DB
+        await env.CACHE.put(
+            cache_key,
+            json.dumps(result),
+            expiration_ttl=3600  # 1 hour
+        )
+
+        return json_response(result, headers)
 
     return json_response({"error": "Method not allowed"}, headers, 405)
 
@@ -214,8 +254,13 @@ async def handle_posts(request, env, headers):
         user_id = 1  # Get from auth token in production
 
         try:
+            # Explicit projection: p.* dragged full multi-KB content
+            # blobs across D1 for all 20 rows; the list view only needs
+            # a preview
             result = await env.DB.prepare(
-                """SELECT p.*, a.credibility_score, a.is_misinformation
+                """SELECT p.id, p.user_id, p.created_at,
+                    SUBSTR(p.content, 1, 200) AS preview,
+                    a.credibility_score, a.is_misinformation
                 FROM posts p
                 LEFT JOIN analysis_results a ON p.id = a.post_id
                 WHERE p.user_id = ?
@@ -240,5 +285,6 @@ def json_response(data, headers, status=200):
     return Response.new(
         json.dumps(data),
         status=status,
-        headers=Headers.new(headers)
+        # Reuse the shared Headers object for the common CORS case
+        headers=_cors_js() if headers is _CORS_HEADERS else Headers.new(headers)
     )
@@ -0,0 +1,17 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+from app.services.text_analyzer import text_analyzer
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_analyzer():
+    """Prime the analyzer once so no single test pays first-call costs
+
+    The first analyze() call compiles the numba kernel and loads
+    TextBlob/NLTK; warming here keeps individual test timings honest.
+    """
+    text_analyzer._warmup()
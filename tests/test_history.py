@@ -0,0 +1,84 @@
+"""
+Tests for scan history keyset pagination
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api.routes import get_scan_history
+from app.db.database import Base
+from app.models.scan import ScanResult
+
+
+def _scan(i: int, ts: datetime) -> ScanResult:
+    return ScanResult(
+        id=f"scan-{i}",
+        content_preview=f"content {i}",
+        content_type="text",
+        content_hash=f"hash-{i}",
+        verdict="UNCLEAR",
+        credibility_score=50,
+        confidence=0.5,
+        timestamp=ts,
+        source_app="test",
+        processing_tier=2,
+        processing_time_ms=1,
+        explanation_summary="summary",
+        explanation_reasons=[],
+        sources=[],
+        cached=False,
+        user_id_hash="user-1",
+    )
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_same_millisecond_rows():
+    """Rows sharing a timestamp across a page boundary are not skipped
+
+    The millisecond-truncated cursor used to drop rows that fell in the
+    boundary row's millisecond; the (timestamp, id) tuple cursor must
+    return every row exactly once.
+    """
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    # tz-aware, as asyncpg returns for the DateTime(timezone=True) column
+    base_ts = datetime(2024, 1, 15, 12, 0, 0, 123456, tzinfo=timezone.utc)
+    async with session_factory() as db:
+        # Three rows with identical timestamps, two more within the same
+        # millisecond, one clearly older
+        for i, ts in enumerate([
+            base_ts,
+            base_ts,
+            base_ts,
+            base_ts - timedelta(microseconds=200),
+            base_ts - timedelta(microseconds=400),
+            base_ts - timedelta(days=1),
+        ]):
+            db.add(_scan(i, ts))
+        await db.commit()
+
+        page = await get_scan_history(
+            user_id_hash="user-1", page=1, page_size=2,
+            before_ts=None, before_id=None, db=db
+        )
+        assert page.total == 6
+        seen = [s.id for s in page.scans]
+
+        # Walk the cursor to exhaustion
+        while page.next_cursor is not None:
+            page = await get_scan_history(
+                user_id_hash="user-1", page=1, page_size=2,
+                before_ts=page.next_cursor, before_id=page.next_cursor_id,
+                db=db
+            )
+            seen.extend(s.id for s in page.scans)
+
+        # Every row exactly once - no skips, no duplicates
+        assert sorted(seen) == [f"scan-{i}" for i in range(6)]
+
+    await engine.dispose()